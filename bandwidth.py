@@ -2,82 +2,98 @@
 
 import time
 import psutil
-from typing import Tuple, Optional
+from typing import Any, Tuple, Optional
 
 
-# Store previous stats for calculating speed
-_prev_stats = {
-    "bytes_sent": 0,
-    "bytes_recv": 0,
-    "timestamp": 0
-}
+# Previous counters and monotonic timestamp for calculating speed
+_prev_sent = 0
+_prev_recv = 0
+_prev_t = 0.0
 
+# Minimum time between psutil reads; faster calls reuse the last result.
+# Callers sample at the poll cadence, this only guards against bursts.
+_min_interval = 0.5  # seconds
+_last_speeds: Tuple[Optional[float], Optional[float]] = (None, None)
 
-def get_bandwidth(interval: float = 1.0) -> Tuple[Optional[float], Optional[float]]:
+# Display units as (size in MB, label)
+_UNITS = [(1 / 1024, "KB/s"), (1, "MB/s"), (1024, "GB/s")]
+SPEED_NA = "N/A"
+
+
+def snapshot() -> Tuple[Any, float]:
+    """Read the system-wide network counters.
+
+    This is the only place that calls psutil.net_io_counters(), so one
+    snapshot can be shared by get_bandwidth() and get_total_usage().
+
+    Returns:
+        Tuple of (counters, monotonic_time).
+    """
+    return psutil.net_io_counters(), time.monotonic()
+
+
+def get_bandwidth(snap: Optional[Tuple[Any, float]] = None) -> Tuple[Optional[float], Optional[float]]:
     """Get current download and upload speeds.
 
+    Speed is averaged over the time since the previous call, measured
+    with a monotonic clock so wall-clock changes don't skew it. Calls made
+    within _min_interval of the previous read return the cached speeds.
+
     Args:
-        interval: Time in seconds between measurements. Default 1.0.
+        snap: Counters from snapshot(). Taken here if not given.
 
     Returns:
         Tuple of (download_speed, upload_speed) in MB/s.
         Returns (None, None) on first call or error.
     """
-    global _prev_stats
+    global _prev_sent, _prev_recv, _prev_t, _last_speeds
+
+    now = snap[1] if snap is not None else time.monotonic()
+    if _prev_t and now - _prev_t < _min_interval:
+        return _last_speeds
+
+    current_stats, current_time = snap if snap is not None else snapshot()
 
-    current_time = time.time()
-    current_stats = psutil.net_io_counters()
+    prev_sent, prev_recv, prev_t = _prev_sent, _prev_recv, _prev_t
+    _prev_sent = current_stats.bytes_sent
+    _prev_recv = current_stats.bytes_recv
+    _prev_t = current_time
 
     # First call - just store stats and return None
-    if _prev_stats["timestamp"] == 0:
-        _prev_stats = {
-            "bytes_sent": current_stats.bytes_sent,
-            "bytes_recv": current_stats.bytes_recv,
-            "timestamp": current_time
-        }
-        return None, None
+    if prev_t == 0:
+        _last_speeds = (None, None)
+        return _last_speeds
 
     # Calculate time delta
-    time_delta = current_time - _prev_stats["timestamp"]
-
-    # Avoid division by zero
-    if time_delta == 0:
-        return None, None
+    time_delta = current_time - prev_t
 
     # Calculate byte deltas
-    sent_delta = current_stats.bytes_sent - _prev_stats["bytes_sent"]
-    recv_delta = current_stats.bytes_recv - _prev_stats["bytes_recv"]
+    sent_delta = current_stats.bytes_sent - prev_sent
+    recv_delta = current_stats.bytes_recv - prev_recv
 
     # Handle counter reset (can happen on some systems)
     if sent_delta < 0 or recv_delta < 0:
-        _prev_stats = {
-            "bytes_sent": current_stats.bytes_sent,
-            "bytes_recv": current_stats.bytes_recv,
-            "timestamp": current_time
-        }
-        return None, None
-
-    # Update previous stats
-    _prev_stats = {
-        "bytes_sent": current_stats.bytes_sent,
-        "bytes_recv": current_stats.bytes_recv,
-        "timestamp": current_time
-    }
+        _last_speeds = (None, None)
+        return _last_speeds
 
     # Calculate speeds in MB/s
     download_speed = (recv_delta / time_delta) / (1024 * 1024)
     upload_speed = (sent_delta / time_delta) / (1024 * 1024)
 
-    return download_speed, upload_speed
+    _last_speeds = (download_speed, upload_speed)
+    return _last_speeds
 
 
-def get_total_usage() -> Tuple[float, float]:
+def get_total_usage(snap: Optional[Tuple[Any, float]] = None) -> Tuple[float, float]:
     """Get total data usage since boot.
 
+    Args:
+        snap: Counters from snapshot(). Taken here if not given.
+
     Returns:
         Tuple of (total_sent_GB, total_recv_GB).
     """
-    stats = psutil.net_io_counters()
+    stats = (snap if snap is not None else snapshot())[0]
     total_sent_gb = stats.bytes_sent / (1024 ** 3)
     total_recv_gb = stats.bytes_recv / (1024 ** 3)
     return total_sent_gb, total_recv_gb
@@ -85,12 +101,11 @@ def get_total_usage() -> Tuple[float, float]:
 
 def reset_bandwidth_stats():
     """Reset bandwidth statistics (mainly for testing)."""
-    global _prev_stats
-    _prev_stats = {
-        "bytes_sent": 0,
-        "bytes_recv": 0,
-        "timestamp": 0
-    }
+    global _prev_sent, _prev_recv, _prev_t, _last_speeds
+    _prev_sent = 0
+    _prev_recv = 0
+    _prev_t = 0.0
+    _last_speeds = (None, None)
 
 
 def format_speed(speed: Optional[float]) -> str:
@@ -103,11 +118,11 @@ def format_speed(speed: Optional[float]) -> str:
         Formatted string (e.g., "5.2 MB/s" or "N/A").
     """
     if speed is None:
-        return "N/A"
+        return SPEED_NA
 
-    if speed < 1:
-        return f"{speed * 1024:.1f} KB/s"
-    return f"{speed:.2f} MB/s"
+    unit = 2 if speed >= 1024 else 1 if speed >= 1 else 0
+    scale, label = _UNITS[unit]
+    return f"{speed / scale:.1f} {label}"
 
 
 if __name__ == "__main__":
@@ -120,10 +135,11 @@ if __name__ == "__main__":
 
     time.sleep(2)
 
-    download, upload = get_bandwidth()
+    snap = snapshot()
+    download, upload = get_bandwidth(snap)
     print(f"Download: {format_speed(download)}")
     print(f"Upload: {format_speed(upload)}")
 
-    total_sent, total_recv = get_total_usage()
+    total_sent, total_recv = get_total_usage(snap)
     print(f"Total sent: {total_sent:.2f} GB")
     print(f"Total received: {total_recv:.2f} GB")
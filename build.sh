@@ -16,12 +16,16 @@ VENV_BIN="./venv/bin"
 # Install dependencies
 echo "Installing dependencies..."
 $VENV_BIN/pip install -r requirements.txt
-$VENV_BIN/pip install py2app
+$VENV_BIN/pip install py2app Cython
 
 # Clean previous build
 echo "Cleaning previous build..."
 rm -rf build dist
 
+# Compile support modules with Cython
+echo "Compiling modules..."
+$VENV_BIN/python setup.py build_ext --build-lib build/ext
+
 # Build the app
 echo "Building app..."
 $VENV_BIN/python setup.py py2app -A
@@ -3,7 +3,23 @@
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared JSON helpers, also used by history.py. Prefer orjson (a C
+# extension) when available; loads accepts bytes, dumps returns compact bytes.
+if orjson is not None:
+    _JSON_LOADS = orjson.loads
+    _JSON_DUMPS = orjson.dumps
+else:
+    _JSON_LOADS = json.loads
+
+    def _JSON_DUMPS(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 
 # Default configuration values
@@ -26,6 +42,7 @@ class Config:
     def __init__(self):
         """Initialize configuration with defaults and load from file if exists."""
         self._config = DEFAULT_CONFIG.copy()
+        self._mtime: Optional[int] = None
         self._ensure_config_dir()
         self.load()
 
@@ -36,18 +53,29 @@ class Config:
     def load(self) -> Dict[str, Any]:
         """Load configuration from file.
 
+        The file is only re-read if its modification time changed since
+        the last load or save.
+
         Returns:
             The loaded configuration dict.
         """
-        if CONFIG_FILE.exists():
-            try:
-                with open(CONFIG_FILE, "r") as f:
-                    loaded = json.load(f)
-                    # Merge with defaults to handle new config keys
-                    self._config = {**DEFAULT_CONFIG, **loaded}
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading config: {e}. Using defaults.")
-                self._config = DEFAULT_CONFIG.copy()
+        try:
+            mtime = CONFIG_FILE.stat().st_mtime_ns
+        except OSError:
+            return self._config
+
+        if mtime == self._mtime:
+            return self._config
+
+        try:
+            with open(CONFIG_FILE, "rb") as f:
+                loaded = _JSON_LOADS(f.read())
+                # Merge with defaults to handle new config keys
+                self._config = {**DEFAULT_CONFIG, **loaded}
+            self._mtime = mtime
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading config: {e}. Using defaults.")
+            self._config = DEFAULT_CONFIG.copy()
         return self._config
 
     def save(self) -> bool:
@@ -59,6 +87,7 @@ class Config:
         try:
             with open(CONFIG_FILE, "w") as f:
                 json.dump(self._config, f, indent=2)
+            self._mtime = CONFIG_FILE.stat().st_mtime_ns
             return True
         except IOError as e:
             print(f"Error saving config: {e}")
@@ -76,17 +105,21 @@ class Config:
         """
         return self._config.get(key, default)
 
-    def set(self, key: str, value: Any) -> bool:
-        """Set a configuration value and save to file.
+    def set(self, key: str, value: Any, save: bool = True) -> bool:
+        """Set a configuration value and optionally save to file.
 
         Args:
             key: Configuration key.
             value: Value to set.
+            save: Save to file immediately. Pass False to batch several
+                changes and call save() once.
 
         Returns:
-            True if saved successfully, False otherwise.
+            True if saved successfully (or not saved), False otherwise.
         """
         self._config[key] = value
+        if not save:
+            return True
         return self.save()
 
     def get_all(self) -> Dict[str, Any]:
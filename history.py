@@ -1,9 +1,16 @@
 """Connection history logging for MacOS NetStat."""
 
+import atexit
 import json
+import os
+import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
+
+from config import _JSON_DUMPS, _JSON_LOADS
 
 
 # History file paths
@@ -11,6 +18,10 @@ CONFIG_DIR = Path.home() / ".macos-netstat"
 HISTORY_FILE = CONFIG_DIR / "history.json"
 MAX_HISTORY_ENTRIES = 100  # Keep last 100 events
 
+# Pending events are written once either limit is reached
+SAVE_INTERVAL = 5.0  # seconds
+SAVE_BATCH_SIZE = 10  # events
+
 
 class HistoryLogger:
     """Logger for connection state changes."""
@@ -22,43 +33,109 @@ class HistoryLogger:
             max_entries: Maximum number of history entries to keep.
         """
         self.max_entries = max_entries
-        self._history: List[Dict] = []
+        # Bounded buffer, oldest entries drop off automatically
+        self._history: Deque[Dict] = deque(maxlen=max_entries)
+        self._dirty = False
+        self._dirty_count = 0
+        self._last_flush_t = 0.0
+        # Running totals so get_stats() doesn't rescan the history
+        self._connected_count = 0
+        self._disconnected_count = 0
+        self._latency_sum = 0
+        self._latency_n = 0
         self._ensure_dir()
         self.load()
+        atexit.register(self.flush, force=True)
 
     def _ensure_dir(self):
         """Create config directory if it doesn't exist."""
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
-    def load(self) -> List[Dict]:
+    def load(self) -> Deque[Dict]:
         """Load history from file.
 
         Returns:
-            List of history entries.
+            Deque of history entries.
         """
         if HISTORY_FILE.exists():
             try:
-                with open(HISTORY_FILE, "r") as f:
-                    self._history = json.load(f)
+                with open(HISTORY_FILE, "rb") as f:
+                    self._history = deque(_JSON_LOADS(f.read()), maxlen=self.max_entries)
             except (json.JSONDecodeError, IOError):
-                self._history = []
+                self._history = deque(maxlen=self.max_entries)
         else:
-            self._history = []
+            self._history = deque(maxlen=self.max_entries)
+
+        self._reset_stats()
+        for entry in self._history:
+            self._tally(entry, 1)
         return self._history
 
+    def _reset_stats(self):
+        """Reset the running statistics."""
+        self._connected_count = 0
+        self._disconnected_count = 0
+        self._latency_sum = 0
+        self._latency_n = 0
+
+    def _tally(self, entry: Dict, sign: int):
+        """Add an entry to (or remove it from) the running statistics.
+
+        Args:
+            entry: History entry.
+            sign: 1 to add the entry, -1 to remove it.
+        """
+        if entry["event"] == "connected":
+            self._connected_count += sign
+        elif entry["event"] == "disconnected":
+            self._disconnected_count += sign
+
+        if entry.get("latency") is not None:
+            self._latency_sum += sign * entry["latency"]
+            self._latency_n += sign
+
     def save(self) -> bool:
         """Save history to file.
 
+        Writes to a temporary file and renames it into place so a crash
+        mid-write never leaves a truncated history file.
+
         Returns:
             True if saved successfully, False otherwise.
         """
+        tmp_file = HISTORY_FILE.with_suffix(".json.tmp")
         try:
-            with open(HISTORY_FILE, "w") as f:
-                json.dump(self._history, f, indent=2)
-            return True
+            with open(tmp_file, "wb") as f:
+                f.write(_JSON_DUMPS(list(self._history)))
+            os.replace(tmp_file, HISTORY_FILE)
         except IOError:
             return False
 
+        self._dirty = False
+        self._dirty_count = 0
+        self._last_flush_t = time.monotonic()
+        return True
+
+    def flush(self, force: bool = False) -> bool:
+        """Save pending events if enough time or events have accumulated.
+
+        Args:
+            force: Save any pending events immediately.
+
+        Returns:
+            True if nothing was pending or saved successfully, False otherwise.
+        """
+        if not self._dirty:
+            return True
+
+        due = (
+            self._dirty_count >= SAVE_BATCH_SIZE
+            or time.monotonic() - self._last_flush_t > SAVE_INTERVAL
+        )
+        if force or due:
+            return self.save()
+        return True
+
     def log_event(self, event_type: str, latency: Optional[int] = None, details: Optional[str] = None):
         """Log a connection event.
 
@@ -67,8 +144,10 @@ class HistoryLogger:
             latency: Latency in ms at time of event (optional).
             details: Additional details about the event (optional).
         """
+        now = time.time()
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.fromtimestamp(now).isoformat(),
+            "ts": int(now),
             "event": event_type,
         }
 
@@ -78,13 +157,14 @@ class HistoryLogger:
         if details is not None:
             entry["details"] = details
 
+        # The deque drops its oldest entry when full
+        if len(self._history) == self.max_entries:
+            self._tally(self._history[0], -1)
         self._history.append(entry)
-
-        # Trim to max entries
-        if len(self._history) > self.max_entries:
-            self._history = self._history[-self.max_entries:]
-
-        self.save()
+        self._tally(entry, 1)
+        self._dirty = True
+        self._dirty_count += 1
+        self.flush()
 
     def get_history(self, limit: Optional[int] = None) -> List[Dict]:
         """Get history entries.
@@ -96,7 +176,7 @@ class HistoryLogger:
             List of history entries.
         """
         if limit:
-            return list(reversed(self._history[-limit:]))
+            return list(islice(reversed(self._history), limit))
         return list(reversed(self._history))
 
     def get_formatted_history(self, limit: int = 20) -> str:
@@ -116,7 +196,12 @@ class HistoryLogger:
         lines = ["Connection History:", "-" * 40]
 
         for entry in entries:
-            timestamp = datetime.fromisoformat(entry["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+            ts = entry.get("ts")
+            if ts is not None:
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+            else:
+                # Entries written before "ts" was added only have ISO timestamps
+                timestamp = datetime.fromisoformat(entry["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
             event = entry["event"].capitalize()
 
             parts = [f"[{timestamp}] {event}"]
@@ -137,7 +222,8 @@ class HistoryLogger:
         Returns:
             True if saved successfully, False otherwise.
         """
-        self._history = []
+        self._history.clear()
+        self._reset_stats()
         return self.save()
 
     def get_stats(self) -> Dict:
@@ -146,17 +232,12 @@ class HistoryLogger:
         Returns:
             Dict with connection statistics.
         """
-        connected_count = sum(1 for e in self._history if e["event"] == "connected")
-        disconnected_count = sum(1 for e in self._history if e["event"] == "disconnected")
-
-        # Calculate average latency
-        latencies = [e.get("latency") for e in self._history if "latency" in e and e["latency"] is not None]
-        avg_latency = sum(latencies) / len(latencies) if latencies else None
+        avg_latency = self._latency_sum / self._latency_n if self._latency_n else None
 
         return {
             "total_events": len(self._history),
-            "connected_count": connected_count,
-            "disconnected_count": disconnected_count,
+            "connected_count": self._connected_count,
+            "disconnected_count": self._disconnected_count,
             "average_latency": avg_latency,
         }
 
@@ -1,10 +1,17 @@
 """Main menu bar app for MacOS NetStat."""
 
 import rumps
+import threading
 import time
+from contextlib import nullcontext
 from typing import Optional
 
-from network import check_connection, measure_latency, get_connection_info
+try:
+    import objc
+except ImportError:
+    objc = None
+
+from network import probe, get_connection_info, invalidate_connection_info
 from bandwidth import get_bandwidth, format_speed, reset_bandwidth_stats
 from config import get_config
 from history import get_history
@@ -19,6 +26,129 @@ COLOR_GREEN = "●"
 COLOR_YELLOW = "●"
 COLOR_RED = "○"
 
+# How often the UI picks up results from the poller thread
+UI_REFRESH_INTERVAL = 1  # seconds
+
+
+class PollerThread(threading.Thread):
+    """Background thread that polls network status at a fixed cadence.
+
+    Network I/O happens here so it never blocks the AppKit runloop. The
+    latest result is kept under a lock for the UI timer to read.
+    """
+
+    def __init__(self, interval: float):
+        """Initialize the poller.
+
+        Args:
+            interval: Time in seconds between polls.
+        """
+        super().__init__(name="NetStatPoller", daemon=True)
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._latest: Optional[dict] = None
+        self._was_connected: Optional[bool] = None
+        self._poll_count = 0  # Number of polls started so far
+        self._wake = threading.Event()
+        self._paused = threading.Event()
+        self._stopped = threading.Event()
+
+    def run(self):
+        """Poll on a monotonic deadline until stopped."""
+        next_deadline = time.monotonic()
+        while not self._stopped.is_set():
+            if self._paused.is_set():
+                self._wake.wait()
+                self._wake.clear()
+                next_deadline = time.monotonic()
+                continue
+
+            # Keep polling if a single check fails, like a timer tick would
+            try:
+                self._poll()
+            except Exception as e:
+                print(f"Error polling network status: {e}")
+
+            next_deadline += self.interval
+            remaining = next_deadline - time.monotonic()
+            if remaining < 0:
+                # Fell behind (slow probe), don't burst to catch up
+                next_deadline = time.monotonic()
+                remaining = 0
+
+            if self._wake.wait(timeout=remaining):
+                self._wake.clear()
+                next_deadline = time.monotonic()
+
+    def _poll(self):
+        """Run a single network check and store the result."""
+        # Drain autoreleased CoreWLAN objects, this thread has no runloop
+        with objc.autorelease_pool() if objc is not None else nullcontext():
+            self._check()
+
+    def _check(self):
+        """Probe connectivity and read connection info."""
+        with self._lock:
+            self._poll_count += 1
+            seq = self._poll_count
+
+        is_connected, latency = probe()
+
+        # Interface or network may have changed, force a fresh read
+        if is_connected != self._was_connected:
+            invalidate_connection_info()
+        self._was_connected = is_connected
+
+        info = get_connection_info() if is_connected else None
+
+        with self._lock:
+            self._latest = {
+                "is_connected": is_connected,
+                "latency": latency,
+                "info": info,
+                "checked_at": time.time(),
+                "seq": seq,
+            }
+
+    def latest(self) -> Optional[dict]:
+        """Get the most recent poll result.
+
+        Returns:
+            Dict with is_connected, latency, info, checked_at and seq (the
+            poll's sequence number), or None if no poll has completed yet.
+        """
+        with self._lock:
+            return self._latest
+
+    def refresh(self) -> Optional[int]:
+        """Trigger an immediate poll without waiting for it.
+
+        Returns:
+            The lowest sequence number of a poll started after this call,
+            or None if polling is paused.
+        """
+        if self._paused.is_set():
+            return None
+        with self._lock:
+            target = self._poll_count + 1
+        self._wake.set()
+        return target
+
+    def pause(self):
+        """Pause polling until resume() is called."""
+        self._paused.set()
+        self._wake.set()
+
+    def resume(self):
+        """Resume polling immediately."""
+        self._paused.clear()
+        self._wake.set()
+
+    def stop(self):
+        """Stop the thread."""
+        self._stopped.set()
+        self._wake.set()
+
 
 class NetStatApp(rumps.App):
     """Menu bar app for network status monitoring."""
@@ -35,12 +165,18 @@ class NetStatApp(rumps.App):
         # Load config
         self.config = get_config()
         self.history = get_history()
+        self._load_settings()
 
         # State tracking
         self.is_connected = False
         self.current_latency = None
+        self.connection_info = None
+        self.current_speeds = (None, None)
         self.is_paused = False
         self.last_check_time = None
+        self._last_titles = {}
+        # Poll sequence number a pending "Refresh Now" is waiting for
+        self._refresh_seq: Optional[int] = None
 
         # Build menu
         self._build_menu()
@@ -48,6 +184,14 @@ class NetStatApp(rumps.App):
         # Start monitoring
         self.start_monitoring()
 
+    def _load_settings(self):
+        """Cache config values read on every tick.
+
+        Call again after changing settings.
+        """
+        self._bw_enabled = self.config.get("bandwidth_enabled", True)
+        self._notif = self.config.get("notifications_enabled", True)
+
     def _build_menu(self):
         """Build the menu items."""
         # Status info items (will be updated dynamically)
@@ -106,55 +250,68 @@ class NetStatApp(rumps.App):
         self.menu.add(self.menu_quit)
 
     def start_monitoring(self):
-        """Start the monitoring timer."""
+        """Start the poller thread and the UI timer."""
         interval = self.config.get("check_interval", 5)
-        rumps.Timer(self.check_status, interval).start()
+        self.poller = PollerThread(interval)
+        self.poller.start()
+        self._timer = rumps.Timer(self.check_status, UI_REFRESH_INTERVAL)
+        self._timer.start()
 
         # Initialize bandwidth stats
-        if self.config.get("bandwidth_enabled", True):
+        if self._bw_enabled:
             reset_bandwidth_stats()
 
     def check_status(self, sender):
-        """Check network status and update UI.
+        """Pick up the latest poll result and update UI.
 
         Args:
             sender: The timer that triggered this check.
         """
-        if self.is_paused:
+        result = self.poller.latest()
+        if result is None:
             return
 
-        self.last_check_time = time.time()
+        # Only apply results from a new poll
+        if result["checked_at"] != self.last_check_time:
+            self.last_check_time = result["checked_at"]
 
-        # Check connection and latency
-        was_connected = self.is_connected
-        self.is_connected = check_connection()
+            was_connected = self.is_connected
+            self.is_connected = result["is_connected"]
+            self.current_latency = result["latency"]
+            self.connection_info = result["info"]
 
-        # Handle connection state change
-        if was_connected != self.is_connected:
-            self._handle_state_change()
+            # Handle connection state change
+            if was_connected != self.is_connected:
+                self._handle_state_change()
 
-        # Get latency if connected
-        if self.is_connected:
-            self.current_latency = measure_latency()
-        else:
-            self.current_latency = None
+            # Sample bandwidth at the poll cadence, not every UI tick
+            if self._bw_enabled and self.is_connected:
+                self.current_speeds = get_bandwidth()
+
+        # Write out any batched history events
+        self.history.flush()
 
         # Update UI
         self._update_ui()
 
+        # Report a manual refresh once a poll started after the click lands
+        if self._refresh_seq is not None and result["seq"] >= self._refresh_seq:
+            self._refresh_seq = None
+            self._show_refresh_result()
+
     def _handle_state_change(self):
         """Handle connection state change (log and notify)."""
         if self.is_connected:
             # Connected
-            latency = measure_latency()
-            info = get_connection_info()
+            latency = self.current_latency
+            info = self.connection_info or {}
             details = f"{info.get('type', 'Unknown')}"
             if info.get('ssid'):
                 details += f" - {info['ssid']}"
 
             self.history.log_event("connected", latency=latency, details=details)
 
-            if self.config.get("notifications_enabled", True):
+            if self._notif:
                 rumps.notification(
                     title="Internet Connected",
                     subtitle=f"Latency: {latency}ms" if latency else "Connected",
@@ -164,8 +321,10 @@ class NetStatApp(rumps.App):
         else:
             # Disconnected
             self.history.log_event("disconnected", details="Connection lost")
+            reset_bandwidth_stats()
+            self.current_speeds = (None, None)
 
-            if self.config.get("notifications_enabled", True):
+            if self._notif:
                 rumps.notification(
                     title="Internet Disconnected",
                     subtitle="No internet connection",
@@ -178,50 +337,67 @@ class NetStatApp(rumps.App):
         # Update title
         if self.is_connected:
             if self.current_latency and self.current_latency >= 100:
-                self.title = COLOR_YELLOW  # Slow
+                title = COLOR_YELLOW  # Slow
             else:
-                self.title = COLOR_GREEN  # Good
+                title = COLOR_GREEN  # Good
         else:
-            self.title = COLOR_RED  # Disconnected
+            title = COLOR_RED  # Disconnected
+
+        if self.title != title:
+            self.title = title
 
         # Update status
         status_text = "Connected" if self.is_connected else "Disconnected"
         status_icon = STATUS_CONNECTED if self.is_connected else STATUS_DISCONNECTED
-        self.menu_status.title = f"Status: {status_icon} {status_text}"
+        self._set_title("status", f"Status: {status_icon} {status_text}")
 
         # Update latency
         if self.current_latency is not None:
-            self.menu_latency.title = f"Ping: {self.current_latency}ms"
+            self._set_title("latency", f"Ping: {self.current_latency}ms")
         else:
-            self.menu_latency.title = "Ping: --"
+            self._set_title("latency", "Ping: --")
 
-        # Update bandwidth if enabled
-        if self.config.get("bandwidth_enabled", True):
-            download, upload = get_bandwidth()
+        # Update bandwidth if enabled (deltas are meaningless while offline)
+        if not self._bw_enabled:
+            self._set_title("bandwidth", "Bandwidth: Disabled")
+        elif self.is_connected:
+            download, upload = self.current_speeds
             down_str = format_speed(download)
             up_str = format_speed(upload)
-            self.menu_bandwidth.title = f"↓ {down_str}  ↑ {up_str}"
+            self._set_title("bandwidth", f"↓ {down_str}  ↑ {up_str}")
         else:
-            self.menu_bandwidth.title = "Bandwidth: Disabled"
+            self._set_title("bandwidth", "Bandwidth: --")
 
         # Update connection info
-        if self.is_connected:
-            info = get_connection_info()
+        if self.is_connected and self.connection_info:
+            info = self.connection_info
             conn_str = info.get("type", "Unknown")
             if info.get('ssid'):
                 conn_str += f" ({info['ssid']})"
-            self.menu_connection.title = f"Connection: {conn_str}"
+            self._set_title("connection", f"Connection: {conn_str}")
         else:
-            self.menu_connection.title = "Connection: --"
+            self._set_title("connection", "Connection: --")
 
         # Update last check time
         if self.last_check_time:
             elapsed = int(time.time() - self.last_check_time)
             if elapsed < 60:
-                self.menu_last_check.title = f"Updated {elapsed}s ago"
+                self._set_title("last_check", f"Updated {elapsed}s ago")
             else:
                 mins = elapsed // 60
-                self.menu_last_check.title = f"Updated {mins}m ago"
+                self._set_title("last_check", f"Updated {mins}m ago")
+
+    def _set_title(self, key: str, title: str):
+        """Set a menu item's title, skipping the AppKit update if unchanged.
+
+        Args:
+            key: Menu item name, e.g. "status" for self.menu_status.
+            title: New title.
+        """
+        if self._last_titles.get(key) == title:
+            return
+        self._last_titles[key] = title
+        getattr(self, f"menu_{key}").title = title
 
     def refresh_now(self, sender):
         """Force a refresh of network status.
@@ -229,7 +405,13 @@ class NetStatApp(rumps.App):
         Args:
             sender: The menu item that triggered this action.
         """
-        self.check_status(None)
+        # The alert is shown by check_status when the new result arrives
+        self._refresh_seq = self.poller.refresh()
+        if self._refresh_seq is None:
+            self._show_refresh_result()
+
+    def _show_refresh_result(self):
+        """Show the outcome of a manual refresh."""
         rumps.alert(
             title="Refresh Complete",
             message=f"Status: {'Connected' if self.is_connected else 'Disconnected'}",
@@ -244,9 +426,14 @@ class NetStatApp(rumps.App):
         """
         self.is_paused = not self.is_paused
         if self.is_paused:
+            self._timer.stop()
+            self.poller.pause()
+            self._refresh_seq = None
             sender.title = "▶️ Resume Monitoring"
             self.title = "⏸️"
         else:
+            self.poller.resume()
+            self._timer.start()
             sender.title = "⏸️ Pause Monitoring"
             self.check_status(None)
 
@@ -291,6 +478,7 @@ class NetStatApp(rumps.App):
                 interval = int(response.text)
                 if 1 <= interval <= 60:
                     self.config.set("check_interval", interval)
+                    self._load_settings()
                     rumps.alert(
                         title="Settings Saved",
                         message=f"Check interval set to {interval} seconds.\n\nRestart app to apply.",
@@ -315,6 +503,8 @@ class NetStatApp(rumps.App):
         Args:
             sender: The menu item that triggered this action.
         """
+        self.poller.stop()
+        self.history.flush(force=True)
         rumps.quit_application()
 
 
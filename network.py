@@ -2,15 +2,75 @@
 
 import time
 import socket
-import subprocess
+import psutil
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Tuple, Optional
 
+try:
+    from CoreWLAN import CWWiFiClient
+except ImportError:
+    CWWiFiClient = None
 
-# Test endpoint that returns 204 No Content (minimal data usage)
-TEST_ENDPOINT = "https://www.google.com/generate_204"
+
+# Test endpoint that returns 204 No Content (minimal data usage).
+# Plain HTTP skips the TLS handshake on every poll.
+TEST_ENDPOINT = "http://connectivitycheck.gstatic.com/generate_204"
 TIMEOUT = 5  # seconds
 
+# Well-known host for the TCP reachability probe (Cloudflare DNS)
+PROBE_HOST = ("1.1.1.1", 53)
+PROBE_TIMEOUT = 2  # seconds
+
+# Shared keep-alive session so connections are reused across polls
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# How long connection info is reused before refreshing
+CONNECTION_INFO_TTL = 30  # seconds
+
+# Cached (timestamp, info) from the last get_connection_info() call
+_connection_info_cache: Optional[Tuple[float, dict]] = None
+
+
+def probe() -> Tuple[bool, Optional[int]]:
+    """Check connectivity and measure latency in a single round-trip.
+
+    Opens a plain TCP connection to a well-known host instead of doing a
+    full HTTP request, so no DNS lookup, TLS handshake or HTTP parsing is
+    needed, and times the connect as the latency. The HTTP 204 check is
+    used as a fallback when the TCP probe times out or is refused (e.g.
+    outbound DNS blocked by a firewall). Other errors such as an
+    unreachable network report disconnected right away.
+
+    Returns:
+        Tuple of (is_connected, latency_ms). Latency is None if not connected.
+    """
+    try:
+        start = time.perf_counter()
+        sock = socket.create_connection(PROBE_HOST, timeout=PROBE_TIMEOUT)
+        end = time.perf_counter()
+        sock.close()
+        return True, int((end - start) * 1000)
+    except (socket.timeout, ConnectionRefusedError):
+        pass
+    except OSError:
+        return False, None
+
+    # Probe was ambiguous, fall back to the HTTP check
+    try:
+        start = time.perf_counter()
+        response = _SESSION.get(TEST_ENDPOINT, timeout=TIMEOUT)
+        end = time.perf_counter()
+    except (requests.RequestException, OSError):
+        return False, None
+
+    if response.status_code == 204:
+        return True, int((end - start) * 1000)
+    return False, None
+
 
 def check_connection() -> bool:
     """Check if internet connection is available.
@@ -18,34 +78,83 @@ def check_connection() -> bool:
     Returns:
         True if connected, False otherwise.
     """
-    try:
-        response = requests.get(TEST_ENDPOINT, timeout=TIMEOUT)
-        return response.status_code == 204
-    except (requests.RequestException, OSError):
-        return False
+    return probe()[0]
 
 
 def measure_latency() -> Optional[int]:
-    """Measure internet latency using HTTP request.
+    """Measure internet latency.
 
     Returns:
         Latency in milliseconds, or None if connection failed.
     """
-    try:
-        start = time.time()
-        response = requests.get(TEST_ENDPOINT, timeout=TIMEOUT)
-        end = time.time()
-
-        if response.status_code == 204:
-            return int((end - start) * 1000)
-        return None
-    except (requests.RequestException, OSError):
-        return None
+    return probe()[1]
 
 
 def get_connection_info() -> dict:
     """Get detailed connection information.
 
+    Results are cached for CONNECTION_INFO_TTL seconds since the SSID and
+    interface rarely change between polls.
+
+    Returns:
+        Dict with connection type, SSID (if WiFi), and local IP.
+    """
+    global _connection_info_cache
+
+    now = time.monotonic()
+    if _connection_info_cache is not None:
+        cached_at, cached_info = _connection_info_cache
+        if now - cached_at < CONNECTION_INFO_TTL:
+            return cached_info.copy()
+
+    info = _read_connection_info()
+    _connection_info_cache = (now, info)
+    return info.copy()
+
+
+def invalidate_connection_info():
+    """Drop the cached connection info so the next call reads it fresh."""
+    global _connection_info_cache
+    _connection_info_cache = None
+
+
+def _wifi_interface():
+    """Get the default WiFi interface via CoreWLAN.
+
+    Returns:
+        The CWInterface, or None if unavailable.
+    """
+    if CWWiFiClient is None:
+        return None
+    return CWWiFiClient.sharedWiFiClient().interface()
+
+
+def _ipv4_addresses() -> dict:
+    """Get the first IPv4 address of each "en*" interface.
+
+    Returns:
+        Dict mapping interface name to IPv4 address. Interfaces without
+        an IPv4 address (e.g. idle Thunderbolt bridge ports) are omitted.
+    """
+    try:
+        if_addrs = psutil.net_if_addrs()
+    except OSError:
+        return {}
+
+    addresses = {}
+    for name, addrs in if_addrs.items():
+        if not name.startswith("en"):
+            continue
+        for addr in addrs:
+            if addr.family == socket.AF_INET:
+                addresses[name] = addr.address
+                break
+    return addresses
+
+
+def _read_connection_info() -> dict:
+    """Read connection information from the system.
+
     Returns:
         Dict with connection type, SSID (if WiFi), and local IP.
     """
@@ -55,48 +164,24 @@ def get_connection_info() -> dict:
         "local_ip": None,
     }
 
-    # Try to get WiFi SSID (macOS only)
-    try:
-        result = subprocess.run(
-            ["/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport", "-I"],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        if result.returncode == 0:
-            for line in result.stdout.split("\n"):
-                if "SSID:" in line and "BSSID" not in line:
-                    info["ssid"] = line.split("SSID:")[1].strip()
-                    info["type"] = "WiFi"
-                    break
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-
-    # Check for Ethernet if WiFi wasn't found
-    if info["type"] == "Unknown":
-        try:
-            # Get network interfaces
-            result = subprocess.run(
-                ["ifconfig"],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            if "en0" in result.stdout:
-                info["type"] = "Ethernet"
-        except subprocess.TimeoutExpired:
-            pass
-
-    # Get local IP address
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(2)
-        # Doesn't actually send data, just gets the routing interface
-        s.connect(("8.8.8.8", 80))
-        info["local_ip"] = s.getsockname()[0]
-        s.close()
-    except (OSError, socket.error):
-        pass
+    addresses = _ipv4_addresses()
+    wifi = _wifi_interface()
+    wifi_name = wifi.interfaceName() if wifi is not None else None
+
+    # WiFi if the CoreWLAN interface is on and has an address. The SSID
+    # needs Location Services permission on newer macOS and may be None.
+    if wifi is not None and wifi.powerOn() and wifi_name in addresses:
+        info["type"] = "WiFi"
+        info["ssid"] = wifi.ssid()
+        info["local_ip"] = addresses[wifi_name]
+        return info
+
+    # Otherwise Ethernet if another "en*" interface has an address
+    for name, address in addresses.items():
+        if name != wifi_name:
+            info["type"] = "Ethernet"
+            info["local_ip"] = address
+            break
 
     return info
 
@@ -108,7 +193,7 @@ def get_external_ip() -> Optional[str]:
         External IP address, or None if unable to determine.
     """
     try:
-        response = requests.get("https://api.ipify.org?format=text", timeout=TIMEOUT)
+        response = _SESSION.get("https://api.ipify.org?format=text", timeout=TIMEOUT)
         return response.text.strip() if response.status_code == 200 else None
     except (requests.RequestException, OSError):
         return None
@@ -119,11 +204,11 @@ if __name__ == "__main__":
     print("Testing network module...")
 
     print("Checking connection...")
-    is_connected = check_connection()
+    is_connected, latency = probe()
     print(f"Connected: {is_connected}")
 
     if is_connected:
-        print(f"Latency: {measure_latency()}ms")
+        print(f"Latency: {latency}ms")
 
         info = get_connection_info()
         print(f"Connection info: {info}")
@@ -3,11 +3,32 @@ Setup script for building standalone macOS app using py2app.
 
 Usage:
     python setup.py py2app
+
+If Cython is installed, the support modules are also compiled to C
+extensions. Build them into build/ext first; py2app then picks them up
+from there instead of the sources:
+
+    python setup.py build_ext --build-lib build/ext
+
+Nothing is written next to the sources, so running main.py from the
+checkout always uses the .py files.
 """
 
+import os
+import sys
+
 from setuptools import setup
 
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
 APP = ['main.py']
+# main.py is the app's entry script and is always run as source
+CYTHON_MODULES = ['network.py', 'bandwidth.py', 'history.py', 'config.py']
+CYTHON_BUILD_DIR = 'build/cython'  # Generated .c files
+EXT_BUILD_DIR = 'build/ext'  # Compiled extension modules
 DATA_FILES = []
 OPTIONS = {
     'argv_emulation': False,
@@ -20,14 +41,28 @@ OPTIONS = {
         'CFBundleShortVersionString': '1.0.0',
         'LSUIElement': True,  # Run as menu bar app (no dock icon)
     },
-    'packages': ['rumps', 'requests', 'psutil'],
+    'packages': ['rumps', 'requests', 'psutil', 'CoreWLAN'],
     'site_packages': True,
 }
 
+if cythonize is not None:
+    EXT_MODULES = cythonize(
+        CYTHON_MODULES,
+        build_dir=CYTHON_BUILD_DIR,
+        compiler_directives={'language_level': 3, 'annotation_typing': False},
+    )
+else:
+    EXT_MODULES = []
+
+# Let py2app find the compiled modules ahead of the .py sources
+if 'py2app' in sys.argv and os.path.isdir(EXT_BUILD_DIR):
+    sys.path.insert(0, os.path.abspath(EXT_BUILD_DIR))
+
 setup(
     name='NetStat',
     app=APP,
     data_files=DATA_FILES,
+    ext_modules=EXT_MODULES,
     options={'py2app': OPTIONS},
     setup_requires=['py2app'],
 )